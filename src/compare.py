@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from typing import Dict, Iterable
 
-from src.models import ComparisonReport
-from src.models import Conflict
-from src.models import Account
+from .models import Account, ComparisonReport, Conflict
+
+
+def _index_by_id(accounts: Iterable[Account]) -> Dict[str, Account]:
+    """Return ``accounts`` keyed by ``id``; later duplicates replace earlier ones."""
+    return {account.id: account for account in accounts}
 
 
 def compare_accounts(
@@ -16,8 +19,7 @@ def compare_accounts(
     """Compare Excel and QuickBooks accounts and identify discrepancies.
 
     This function reconciles accounts from two sources (Excel and QuickBooks)
-    by comparing their ``id`` field. Students must implement
-    the logic to detect three types of discrepancies:
+    by comparing their ``id`` field and detects three types of discrepancies:
 
     1. Accounts that exist only in Excel
     2. Accounts that exist only in QuickBooks
@@ -25,14 +27,14 @@ def compare_accounts(
 
     **Input Parameters:**
 
-    :param excel_terms: An iterable of :class:`~src.models.Account`
+    :param excel_accounts: An iterable of :class:`~src.models.Account`
         objects sourced from Excel. Each Account has:
 
         - ``AccountType`` (str): account type identifier
         - ``id`` (str): Unique identifier of the account
         - ``name`` (str): Display name of the account type
         - ``number`` (str): Account number
-        - ``source`` (SourceLiteral): Will be "excel" for these terms
+        - ``source`` (SourceLiteral): Will be "excel" for these accounts
 
         Example: ``Account(AccountType="Other Expense", id="101" name="Expense", number="123", source="excel")``
 
@@ -45,24 +47,22 @@ def compare_accounts(
     **Return Value:**
 
     :return: A :class:`~src.models.ComparisonReport` object containing
-        three lists that categorize all discrepancies found:
+        three lists that categorize all discrepancies found, plus a count of
+        identical accounts:
 
-        - ``excel_only`` (list[PaymentTerm]): Types with ``account_type`` values that
-          appear in ``excel_terms`` but NOT in ``qb_terms``. These represent account
-          types that need to be added to QuickBooks.
+        - ``added_chart_of_accounts`` (list[Account]): Accounts whose ``id``
+          appears in ``excel_accounts`` but NOT in ``qb_accounts``. These
+          represent accounts that need to be added to QuickBooks.
 
-        - ``qb_only`` (list[PaymentTerm]): Types with ``account_type`` values that
-          appear in ``qb_terms`` but NOT in ``excel_terms``. These represent account
-          types that may need to be removed from QuickBooks or added to Excel.
+        - ``qb_only`` (list[Account]): Accounts whose ``id`` appears in
+          ``qb_accounts`` but NOT in ``excel_accounts``. These represent accounts
+          that may need to be removed from QuickBooks or added to Excel.
 
-        - ``conflicts`` (list[Conflict]): Types where the same ``id`` exists
+        - ``conflicts`` (list[Conflict]): Accounts where the same ``id`` exists
           in both sources but the ``name`` and/or ``number`` and/or ``AccountType``
-          field differs. Each :class:`~src.models.Conflict` must have:
-
-          - id: str Identifier of the account type with the conflict
+          field differs. Each :class:`~src.models.Conflict` has:
 
-          - excel_AccountType: str - The account type from Excel
-          - qb_AccountType: str - The account type from QuickBooks
+          - record_id: str | None - Identifier of the account with the conflict
 
           - excel_name: str | None - The name from Excel
           - qb_name: str | None - The name from QuickBooks
@@ -70,19 +70,25 @@ def compare_accounts(
           - excel_number: str | None - The number from Excel
           - qb_number: str | None - The number from QuickBooks
 
-         reason: ConflictReason - Set to "data_mismatch" to indicate differing data
+          - excel_AccountType: str | None - The account type from Excel
+          - qb_AccountType: str | None - The account type from QuickBooks
+
+          - ConflictReason: str - Set to "data_mismatch" to indicate differing data
+
+        - ``same_accounts`` (int): Number of accounts whose ``id`` exists in both
+          sources with identical ``name``, ``number`` and ``AccountType``.
 
     **Example:**
 
     Given these inputs::
 
-        excel_terms = [
+        excel_accounts = [
             Account(AccountType="ASSET", id="1", name="Asset", number="1000", source="excel"),
             Account(AccountType="EXPENSE", id="2", name="Expense", number="2000", source="excel"),
             Account(AccountType="INCOME", id="3", name="Income", number="3000", source="excel"),
         ]
 
-        qb_terms = [
+        qb_accounts = [
             Account(AccountType="LIABILITY", id="4", name="Liability", number="4000", source="quickbooks"),
             Account(AccountType="EXPENSE", id="2", name="Expenses", number="2000", source="quickbooks"),
             Account(AccountType="INCOME", id="3", name="Income", number="3000", source="quickbooks"),
@@ -91,20 +97,22 @@ def compare_accounts(
     Expected output::
 
         ComparisonReport(
-            excel_only=[Account(AccountType="ASSET", id="1", name="Asset", number="1000", source="excel")],
+            added_chart_of_accounts=[Account(AccountType="ASSET", id="1", name="Asset", number="1000", source="excel")],
             qb_only=[Account(AccountType="LIABILITY", id="4", name="Liability", number="4000", source="quickbooks")],
-            conflicts=[id= "2",
-                       excel_AccountType="EXPENSE", qb_AccountType="EXPENSE",
-                       excel_name="Expense", qb_name="Expenses",
-                       excel_number="2000", qb_number="2000",
-                       reason="data_mismatch"]
+            conflicts=[Conflict(record_id="2",
+                                excel_name="Expense", qb_name="Expenses",
+                                excel_number="2000", qb_number="2000",
+                                excel_AccountType="EXPENSE", qb_AccountType="EXPENSE",
+                                ConflictReason="data_mismatch")],
+            same_accounts=1,
         )
 
     Note: INCOME appears in both sources with the same data, so it does not appear
     in any of the report's collections (no conflict, not Excel-only, not QB-only).
+    It is instead counted in ``same_accounts``.
     """
-    excel_dict: Dict[str, Account] = {account.id: account for account in excel_accounts}
-    qb_dict: Dict[str, Account] = {account.id: account for account in qb_accounts}
+    excel_dict = _index_by_id(excel_accounts)
+    qb_dict = _index_by_id(qb_accounts)
 
     added_chart_of_accounts = [
         account for aID, account in excel_dict.items() if aID not in qb_dict
@@ -112,35 +120,37 @@ def compare_accounts(
     qb_only = [account for aID, account in qb_dict.items() if aID not in excel_dict]
 
     conflicts = []
-    for aID in set(excel_dict.keys()).intersection(qb_dict.keys()):
-        excel_name = excel_dict[aID].name
-        qb_name = qb_dict[aID].name
-        excel_number = excel_dict[aID].number
-        qb_number = qb_dict[aID].number
-        excel_atype = excel_dict[aID].AccountType
-        qb_atype = qb_dict[aID].AccountType
+    same_accounts = 0
+    for aID in excel_dict.keys() & qb_dict.keys():
+        excel_account = excel_dict[aID]
+        qb_account = qb_dict[aID]
+        # Fast path for the common, already-synchronised case: compare the
+        # fields directly so evaluation stops at the first difference.
         if (
-            excel_name != qb_name
-            or excel_number != qb_number
-            or excel_atype != qb_atype
+            excel_account.name == qb_account.name
+            and excel_account.number == qb_account.number
+            and excel_account.AccountType == qb_account.AccountType
         ):
-            conflicts.append(
-                Conflict(
-                    record_id=aID,  # Updated to reflect comparison of account types
-                    excel_name=excel_name,
-                    qb_name=qb_name,
-                    excel_number=excel_number,
-                    qb_number=qb_number,
-                    excel_AccountType=excel_atype,
-                    qb_AccountType=qb_atype,
-                    ConflictReason="data_mismatch",
-                )
+            same_accounts += 1
+            continue
+        conflicts.append(
+            Conflict(
+                aID,
+                excel_account.name,
+                qb_account.name,
+                excel_account.number,
+                qb_account.number,
+                excel_account.AccountType,
+                qb_account.AccountType,
+                "data_mismatch",
             )
+        )
 
     return ComparisonReport(
         added_chart_of_accounts=added_chart_of_accounts,
         qb_only=qb_only,
         conflicts=conflicts,
+        same_accounts=same_accounts,
     )
 
 
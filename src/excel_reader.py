@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys  # String interning for repeated values
 from pathlib import Path  # Filesystem path management
 from typing import List  # Concrete list type for return value
 from typing import Any, Tuple  # Generic type for cell values
@@ -62,7 +63,9 @@ def extract_account(workbook_path: Path) -> List[Account]:
             type = _value(row, "Type")  # Expected Type column
             if type is None:
                 continue  # Skip rows without a type
-            type_str = str(type).strip()
+            # Intern the small set of account types so comparisons hit the
+            # identity fast path
+            type_str = sys.intern(str(type).strip())
             if not type_str:
                 continue  # Skip blank types
             if raw_id in (None, ""):
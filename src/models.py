@@ -24,17 +24,17 @@ class Account:
         return f"Account(id={self.id}, name={self.name}, number={self.number}, type={self.AccountType}, source={self.source})\n"
 
 
-@dataclass
+@dataclass(slots=True)
 class Conflict:
     """Represents a conflict between Excel and QuickBooks accounts."""
 
-    excel_AccountType: str | None
-    qb_AccountType: str | None
     record_id: str | None
-    excel_number: str | None
-    qb_number: str | None
     excel_name: str | None
     qb_name: str | None
+    excel_number: str | None
+    qb_number: str | None
+    excel_AccountType: str | None
+    qb_AccountType: str | None
     ConflictReason: str
 
 
@@ -45,6 +45,7 @@ class ComparisonReport:
     added_chart_of_accounts: list[Account] = field(default_factory=list)
     qb_only: list[Account] = field(default_factory=list)
     conflicts: list[Conflict] = field(default_factory=list)
+    same_accounts: int = 0
 
 
 __all__ = [
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 import xml.etree.ElementTree as ET
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -76,7 +77,7 @@ def fetch_accounts(company_file: str | None = None) -> list[Account]:
         id = account_ret.findtext("Desc") or ""
         name = account_ret.findtext("Name") or ""
         acc_number = account_ret.findtext("AccountNumber") or ""
-        acc_type = account_ret.findtext("AccountType") or ""
+        acc_type = sys.intern(account_ret.findtext("AccountType") or "")
 
         if not id:
             continue
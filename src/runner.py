@@ -8,79 +8,46 @@ report summarising the outcome.
 
 from __future__ import annotations
 
+from functools import lru_cache  # Memoise workbook parsing
 from pathlib import Path  # Filesystem path handling
-from typing import Dict, List  # Type annotations for clarity
+from typing import Dict, List, Tuple  # Type annotations for clarity
 
 from . import compare, excel_reader, qb_gateway  # Local modules used in orchestration
-from .models import Conflict, Account  # Domain types
+from .models import Account  # Domain types
 from .reporting import iso_timestamp, write_report  # JSON and timestamps
 
 DEFAULT_REPORT_NAME = "chartOfAccounts_report.json"  # Default output filename
 
 
-def _account_to_dict(account: Account) -> Dict[str, str]:
-    """Convert a Account object into a serialisable dict.
+@lru_cache(maxsize=1)
+def _cached_excel_accounts(
+    workbook_path: Path, mtime_ns: int, size: int
+) -> Tuple[Account, ...]:
+    """Parse the workbook once per (path, mtime, size) fingerprint.
 
-    This shape is used in the JSON report's "added_accounts" collection.
+    ``mtime_ns`` and ``size`` are not used directly; they form part of the
+    cache key so an edited workbook is parsed again.
     """
-    return {
-        "id": account.id,
-        "name": account.name,
-        "number": account.number,
-        "type": account.AccountType,
-        "source": account.source,
-    }
-
-
-def _conflict_to_dict(conflict: Conflict) -> Dict[str, object]:
-    """Convert a Conflict object into a serialisable dict for the report."""
-    return {
-        "record_id": conflict.record_id,
-        "excel_name": conflict.excel_name,
-        "qb_name": conflict.qb_name,
-        "excel_number": conflict.excel_number,
-        "qb_number": conflict.qb_number,
-        "excel_type": conflict.excel_AccountType,
-        "qb_type": conflict.qb_AccountType,
-        "reason": conflict.ConflictReason,
-    }
+    return tuple(excel_reader.extract_account(workbook_path))
 
 
-def _missing_in_excel_conflict(term: Account) -> Dict[str, object]:
-    """Create a synthetic conflict for accounts present only in QuickBooks.
+def _read_excel_accounts(workbook_path: str) -> Tuple[Account, ...]:
+    """Return accounts from the workbook, reusing the last parse if unchanged.
 
-    In the report, accounts that exist in QuickBooks but not Excel are represented
-    as conflicts with reason "missing_in_excel".
+    The cache lives in the current process, so it only benefits library
+    callers that invoke :func:`run_chart_of_accounts` repeatedly; the CLI runs
+    once per process and always parses the workbook. Only the Excel side is
+    cached. QuickBooks is always queried again since each run may add
+    accounts to it.
     """
-    return {
-        "record_id": term.id,
-        "excel_name": None,
-        "qb_name": term.name,
-        "excel_number": None,
-        "qb_number": term.number,
-        "excel_type": None,
-        "qb_type": term.AccountType,
-        "reason": "missing_in_excel",
-    }
-
-
-def _count_matching_terms(excel_terms: List[Account], qb_terms: List[Account]) -> int:
-    """Return the number of accounts that exist in both sources with identical data."""
-
-    excel_by_id = {term.id: term for term in excel_terms}
-    qb_by_id = {term.id: term for term in qb_terms}
-
-    matches = 0
-    for record_id in excel_by_id.keys() & qb_by_id.keys():
-        excel_term = excel_by_id[record_id]
-        qb_term = qb_by_id[record_id]
-        if (
-            excel_term.name == qb_term.name
-            and excel_term.number == qb_term.number
-            and excel_term.AccountType == qb_term.AccountType
-        ):
-            matches += 1
-    return matches
+    path = Path(workbook_path)
+    resolved = path.resolve()  # Cache key only
+    try:
+        stat = resolved.stat()
+    except OSError:
+        # Let the reader raise its own error for a missing workbook
+        return tuple(excel_reader.extract_account(path))
+    return _cached_excel_accounts(resolved, stat.st_mtime_ns, stat.st_size)
 
 
 def run_chart_of_accounts(
@@ -116,7 +83,7 @@ def run_chart_of_accounts(
 
     try:
         # Extract terms from the Excel workbook
-        excel_terms = excel_reader.extract_account(Path(workbook_path))
+        excel_terms = _read_excel_accounts(workbook_path)
         # Fetch existing terms from QuickBooks
         qb_terms = qb_gateway.fetch_accounts(company_file_path)
         # Compare the two sources to find discrepancies
@@ -128,20 +95,48 @@ def run_chart_of_accounts(
         )
 
         # Build conflicts list: name mismatches + items missing from Excel
-        conflicts: List[Dict[str, object]] = []
-        conflicts.extend(
-            _conflict_to_dict(conflict) for conflict in comparison.conflicts
-        )
-        conflicts.extend(
-            _missing_in_excel_conflict(term) for term in comparison.qb_only
-        )
+        conflicts: List[Dict[str, object]] = [
+            {
+                "record_id": conflict.record_id,
+                "excel_name": conflict.excel_name,
+                "qb_name": conflict.qb_name,
+                "excel_number": conflict.excel_number,
+                "qb_number": conflict.qb_number,
+                "excel_type": conflict.excel_AccountType,
+                "qb_type": conflict.qb_AccountType,
+                "reason": conflict.ConflictReason,
+            }
+            for conflict in comparison.conflicts
+        ]
+        # Accounts present only in QuickBooks are reported as synthetic
+        # conflicts with reason "missing_in_excel"
+        conflicts += [
+            {
+                "record_id": term.id,
+                "excel_name": None,
+                "qb_name": term.name,
+                "excel_number": None,
+                "qb_number": term.number,
+                "excel_type": None,
+                "qb_type": term.AccountType,
+                "reason": "missing_in_excel",
+            }
+            for term in comparison.qb_only
+        ]
 
         # Populate the report payload with results
         report_payload["added_chart_of_accounts"] = [
-            _account_to_dict(term) for term in added_terms
+            {
+                "id": term.id,
+                "name": term.name,
+                "number": term.number,
+                "type": term.AccountType,
+                "source": term.source,
+            }
+            for term in added_terms
         ]
         report_payload["conflicts"] = conflicts
-        report_payload["same_accounts"] = _count_matching_terms(excel_terms, qb_terms)
+        report_payload["same_accounts"] = comparison.same_accounts
 
     except Exception as exc:  # pragma: no cover - behaviour verified via tests
         # On any error, capture the message and mark the report as failure
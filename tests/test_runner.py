@@ -0,0 +1,133 @@
+"""Tests for the chart of accounts runner."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+from src import qb_gateway, runner
+from src.models import Account
+
+
+def _write_workbook(path: Path, rows: list[tuple[object, ...]]) -> Path:
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "chartofaccount"
+    sheet.append(("ID", "Number", "Name", "Type"))
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _clear_workbook_cache() -> None:
+    runner._cached_excel_accounts.cache_clear()
+
+
+def test_read_excel_accounts_reuses_unchanged_workbook(tmp_path: Path) -> None:
+    workbook = _write_workbook(tmp_path / "accounts.xlsx", [(1, 1000, "Cash", "Bank")])
+
+    first = runner._read_excel_accounts(str(workbook))
+    second = runner._read_excel_accounts(str(workbook))
+
+    assert second is first
+    assert runner._cached_excel_accounts.cache_info().hits == 1
+
+
+def test_read_excel_accounts_reparses_after_mtime_change(tmp_path: Path) -> None:
+    workbook = _write_workbook(tmp_path / "accounts.xlsx", [(1, 1000, "Cash", "Bank")])
+    first = runner._read_excel_accounts(str(workbook))
+
+    stat = workbook.stat()
+    os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = runner._read_excel_accounts(str(workbook))
+
+    assert second is not first
+    assert second == first
+    assert runner._cached_excel_accounts.cache_info().misses == 2
+
+
+def test_run_reports_missing_workbook_path_as_given(tmp_path: Path) -> None:
+    report_path = runner.run_chart_of_accounts(
+        "", "nope.xlsx", output_path=str(tmp_path / "report.json")
+    )
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["status"] == "error"
+    assert report["error"] == "Workbook not found: nope.xlsx"
+
+
+def test_run_chart_of_accounts_full_pipeline(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    workbook = _write_workbook(
+        tmp_path / "accounts.xlsx",
+        [
+            (1, 1000, "Asset", "Bank"),
+            (2, 2000, "Expense", "Expense"),
+            (3, 3000, "Income", "Income"),
+        ],
+    )
+    qb_accounts = [
+        Account("Expense", "2000", "Expenses", "2", "quickbooks"),
+        Account("Income", "3000", "Income", "3", "quickbooks"),
+        Account("OtherCurrentLiability", "4000", "Liability", "4", "quickbooks"),
+    ]
+    added: list[Account] = []
+
+    def fake_add_accounts_batch(
+        company_file: str | None, terms: list[Account]
+    ) -> list[Account]:
+        added.extend(terms)
+        return [
+            Account(t.AccountType, t.number, t.name, t.id, "quickbooks") for t in terms
+        ]
+
+    monkeypatch.setattr(qb_gateway, "fetch_accounts", lambda _: qb_accounts)
+    monkeypatch.setattr(qb_gateway, "add_accounts_batch", fake_add_accounts_batch)
+
+    report_path = runner.run_chart_of_accounts(
+        "", str(workbook), output_path=str(tmp_path / "report.json")
+    )
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["status"] == "success"
+    assert report["error"] is None
+    assert [account.id for account in added] == ["1"]
+    assert report["added_chart_of_accounts"] == [
+        {
+            "id": "1",
+            "name": "Asset",
+            "number": "1000",
+            "type": "Bank",
+            "source": "quickbooks",
+        }
+    ]
+    assert report["conflicts"] == [
+        {
+            "record_id": "2",
+            "excel_name": "Expense",
+            "qb_name": "Expenses",
+            "excel_number": "2000",
+            "qb_number": "2000",
+            "excel_type": "Expense",
+            "qb_type": "Expense",
+            "reason": "data_mismatch",
+        },
+        {
+            "record_id": "4",
+            "excel_name": None,
+            "qb_name": "Liability",
+            "excel_number": None,
+            "qb_number": "4000",
+            "excel_type": None,
+            "qb_type": "OtherCurrentLiability",
+            "reason": "missing_in_excel",
+        },
+    ]
+    assert report["same_accounts"] == 1